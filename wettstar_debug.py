@@ -12,11 +12,11 @@ import re
 import sys
 import argparse
 from pathlib import Path
+from bs4 import BeautifulSoup
 
 
 async def debug_race(race_id: int, output_dir: str = './debug_output/'):
     from playwright.async_api import async_playwright
-    from bs4 import BeautifulSoup
 
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     url = f'https://wettstar-pferdewetten.de/race/{race_id}'
@@ -43,7 +43,7 @@ async def debug_race(race_id: int, output_dir: str = './debug_output/'):
         print(f"✅ HTML gespeichert: {html_path} ({len(html)} chars)")
 
         # 2. Struktur-Analyse
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         print("\n=== STRUKTUR-ANALYSE ===")
 
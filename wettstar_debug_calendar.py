@@ -30,7 +30,7 @@ async def debug_calendar(date_str: str, output_dir: str = './debug_output/'):
             f.write(html)
         print(f'HTML: {len(html)} chars → {out}')
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Deutschland-Meetings
         print('\n=== DEUTSCHLAND-MEETINGS ===')
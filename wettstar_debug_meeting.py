@@ -30,7 +30,7 @@ async def debug_meeting(date_str: str, meeting_id: int, output_dir: str = './deb
             f.write(html)
         print(f'✅ HTML gespeichert: {out} ({len(html)} chars)')
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # 1. Alle /race/ Links
         print('\n=== ALLE /race/ LINKS ===')
@@ -11,18 +11,26 @@ Usage:
   python wettstar_results_scraper.py --race-id 2492829
   python wettstar_results_scraper.py --from-date 2024-01-01 --to-date 2024-12-31
   python wettstar_results_scraper.py --from-date 2025-01-01
+  python wettstar_results_scraper.py --from-date 2025-01-01 --no-cache
 
 Dependencies:
-  pip install playwright beautifulsoup4
+  pip install playwright lxml orjson "httpx[http2]"
   playwright install chromium && playwright install-deps chromium
 """
 
-import asyncio, re, csv, sys, json, argparse
+import asyncio, re, csv, os, sys, gzip, operator, argparse, multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+import orjson
 
-BASE = 'https://wettstar-pferdewetten.de'
+BASE       = 'https://wettstar-pferdewetten.de'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0'
 
 FIELDNAMES = [
     'race_id','race_date','venue','race_nr','race_name',
@@ -36,113 +44,205 @@ FIELDNAMES = [
     'zweier_combo','zweier_quote','dreier_combo','dreier_quote',
 ]
 
+# Row-Dict → Spaltenwerte in FIELDNAMES-Reihenfolge (jede Row hat alle Keys)
+_ROW_VALUES = operator.itemgetter(*FIELDNAMES)
+
+# ── Regex-Patterns (einmal beim Import kompiliert) ────────────────────────────
+_PAT_MEETING_ID     = re.compile(r'meeting-id--(\d+)')
+_PAT_PARENS_NUM     = re.compile(r'\((\d+)\)')          # "(8)" Rennen / "(4)" Box
+_PAT_RACEID         = re.compile(r'/race/(\d+)')
+_PAT_RACE_NR        = re.compile(r'R(\d+)')
+_PAT_NAME           = re.compile(r'Rennen\s+(?:des|der|vom|von)\s+(.+?)(?:\n|,|\|)')
+_PAT_AGEGEN         = re.compile(r'(\d+)j\.\s*([A-Z])')
+_PAT_WEIGHT         = re.compile(r'([\d.]+)\s*kg')
+_PAT_TRAINER_PARENS = re.compile(r'^\(|\)$')
+_PAT_FINISH         = re.compile(r'(\d+)')
+_PAT_DECIMAL        = re.compile(r'(\d+(?:[.,]\d+)?)')
+_PAT_POOL2          = re.compile(r'^(\d+\s*-\s*\d+)\s+([\d,\.]+)$')
+_PAT_POOL3          = re.compile(r'^(\d+\s*-\s*\d+\s*-\s*\d+)\s+([\d,\.]+)$')
+
+# Meta-Felder aus dem Volltext der Race-Seite (siehe _parse_meta_fields)
+_PAT_DISTANCE       = re.compile(r'(\d{3,4})\s*m')
+_PAT_PRIZE          = re.compile(r'Preisgeld\D{0,10}([\d.]+)\s*€')
+_PAT_STARTERS       = re.compile(r'Starter\D{0,5}(\d+)')
+_PAT_TIME           = re.compile(r'(\d{2}:\d{2})\s*Uhr')
+_PAT_CLASS          = re.compile(r'Kategorie\s+([A-Z])')
+_PAT_AGE            = re.compile(r'Alter:\s*(\d+)')
+
+
+# ── lxml-Helfer ───────────────────────────────────────────────────────────────
+
+def _cls(name: str) -> str:
+    """XPath-Prädikat: Element trägt die CSS-Klasse `name` (ganzer Klassen-Token)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _xp_cls(name: str, tag: str = '*'):
+    """Kompilierte XPath: alle Nachfahren `tag` mit CSS-Klasse `name`."""
+    return etree.XPath(f'.//{tag}[{_cls(name)}]')
+
+
+def _xp_sub(part: str):
+    """Kompilierte XPath: alle Nachfahren, deren class-Attribut `part` enthält."""
+    return etree.XPath(f".//*[contains(@class, '{part}')]")
+
+
+# Dokument-Ebene
+_XP_COUNTRIES     = etree.XPath(f'//*[{_cls("ttml__country")}]')
+_XP_RACE_HREFS    = etree.XPath(f'//a[{_cls("meetinginfo__racenumber")}]/@href')
+_XP_STARTER_ROWS  = etree.XPath("//*[contains(@class, '--rg-is-starter')]")
+_XP_BREADCRUMBS   = [
+    ('race_date', etree.XPath("//*[contains(@class, '-breadcrumb-date')]")),
+    ('venue',     etree.XPath("//*[contains(@class, '-breadcrumb-name')]")),
+    ('race_nr',   etree.XPath("//*[contains(@class, '-breadcrumb-race')]")),
+]
+
+# Kalender (relativ zum Länder- bzw. Meeting-Block)
+_XP_COUNTRY_NAME  = _xp_cls('ttml__country__name')
+_XP_MEETINGS      = _xp_sub('meeting-id--')
+_XP_MEETING_TITLE = _xp_cls('ttml__meeting__title--subject')
+
+# Starter-Zeile (relativ zur Row)
+_XP_ROW_NAME      = _xp_cls('race__grid__row__name')
+_XP_STRONG        = etree.XPath('.//strong')
+_XP_NAME_PARTS    = etree.XPath('.//strong|.//span')
+_XP_PILLS         = _xp_cls('race__grid__row__vars__pills')
+_XP_JOCKEY        = _xp_cls('race__grid__row__humans__jockey')
+_XP_TRAINER       = _xp_cls('race__grid__row__humans__trainer')
+_XP_TREND_TABLE   = _xp_cls('trendTrendsTable', 'table')
+_XP_TREND_ROWS    = etree.XPath(f'.//tr[not(.//*[{_cls("trendTrendsTable__row__divider")}])]')
+_XP_ML            = _xp_cls('ml', 'td')
+_XP_FINISH        = _xp_cls('race__grid__row__finish')
+_XP_FONT_SIZE     = _xp_sub('font-size')
+_XP_ODDS          = {t: _xp_sub(f'type-{t}') for t in ('tote', 'fix', 'plcodd_fix')}
+_XP_ODD_VALUE     = _xp_cls('c-runner-odd__value')
+
+# Tabellen
+_XP_ROWS          = etree.XPath('.//tr')
+_XP_CELLS         = etree.XPath('./td|./th')   # nur direkte Zellen, nicht in Untertabellen
+
+
+def parse_html(html: str):
+    """HTML → lxml-Root; <script>/<style> raus, damit Text-Regexe nur sichtbaren Text sehen."""
+    root = lxml.html.fromstring(html)
+    etree.strip_elements(root, 'script', 'style', with_tail=False)
+    return root
+
+
+def _text(el, sep: str = '') -> str:
+    """Textknoten einzeln strippen, leere verwerfen, mit `sep` verbinden."""
+    return sep.join(t for t in (t.strip() for t in el.itertext()) if t)
+
+
+def _first(nodes):
+    return nodes[0] if nodes else None
+
 
 # ── Stufe 1: Kalender → DE-Meeting-IDs ───────────────────────────────────────
 
-def get_de_meetings_from_calendar(soup) -> list[dict]:
+def get_de_meetings_from_calendar(root) -> list[dict]:
     """
     Extrahiert alle deutschen Galopp-Meetings aus der Kalenderseite.
     Returns: [{meeting_id, venue, n_races}, ...]
     """
     result = []
-    for cb in soup.find_all(class_='ttml__country'):
-        name_el = cb.find(class_='ttml__country__name')
-        if not name_el or 'Deutschland' not in name_el.get_text():
+    for cb in _XP_COUNTRIES(root):
+        name_el = _first(_XP_COUNTRY_NAME(cb))
+        if name_el is None or 'Deutschland' not in name_el.text_content():
             continue
-        for m in cb.find_all(class_=re.compile(r'meeting-id--\d+')):
-            cls_str = ' '.join(m.get('class', []))
-            mid     = re.search(r'meeting-id--(\d+)', cls_str)
-            ven_el  = m.find(class_='ttml__meeting__title--subject')
-            venue   = ven_el.get_text(strip=True) if ven_el else ''
-            n_races = re.search(r'\((\d+)\)', venue)
+        for m in _XP_MEETINGS(cb):
+            cls_str = m.get('class', '')
+            mid     = _PAT_MEETING_ID.search(cls_str)
+            if not mid:
+                continue
+            ven_el  = _first(_XP_MEETING_TITLE(m))
+            venue   = _text(ven_el) if ven_el is not None else ''
+            n_races = _PAT_PARENS_NUM.search(venue)
 
             # Nur Galopp-Hauptmeeting – funktioniert für 2024 + 2025:
             #   icon--r-gallop = Galopp  (beide Jahre)
             #   icon--r-trot   = Trab    → skip
             #   pmu-int        = PMU-Duplikat (2025) → skip (gleiche Rennen)
-            meeting_html = str(m)
+            meeting_html = etree.tostring(m, encoding='unicode')
             if 'icon--r-gallop' not in meeting_html:
                 continue
             if 'pmu-int' in meeting_html:
                 continue
 
-            if mid:
-                result.append({
-                    'meeting_id': int(mid.group(1)),
-                    'venue':      venue,
-                    'n_races':    int(n_races.group(1)) if n_races else 8,
-                })
+            result.append({
+                'meeting_id': int(mid.group(1)),
+                'venue':      venue,
+                'n_races':    int(n_races.group(1)) if n_races else 8,
+            })
     return result
 
 
 # ── Stufe 2: Meeting-Seite → Race-IDs ────────────────────────────────────────
 
-def get_race_ids_from_meeting(soup) -> list[int]:
+def get_race_ids_from_meeting(root) -> set[int]:
     """
     Extrahiert Race-IDs aus einer Meeting-Seite.
     Nutzt class='meetinginfo__racenumber' – das sind die echten Meeting-Rennen.
     Ignoriert nextraces__race Links (= internationale Nächste-Rennen-Navigation).
     """
-    ids = []
-    for a in soup.find_all('a', class_='meetinginfo__racenumber'):
-        m = re.search(r'/race/(\d+)', a.get('href', ''))
-        if m:
-            ids.append(int(m.group(1)))
-    return sorted(set(ids))
+    return {int(m.group(1))
+            for m in map(_PAT_RACEID.search, _XP_RACE_HREFS(root)) if m}
 
 
 # ── Stufe 3: Race-Seite → Ergebnisse ─────────────────────────────────────────
 
-def parse_race_page(html: str, race_id: int) -> list[dict]:
-    if 'Ergebnis' not in html:
-        return []
-    soup     = BeautifulSoup(html, 'html.parser')
-    meta     = extract_race_meta(soup)
+def parse_race_page(root, race_id: int) -> list[dict]:
+    """root = bereits geparste Race-Seite (parse_html); 'Ergebnis'-Check macht der Aufrufer."""
+    text     = ' '.join(root.itertext())   # einmal pro Seite, für die Meta-Regexe
+    meta     = extract_race_meta(root, text)
     meta['race_id'] = race_id
-    ev_data  = extract_ev_table(soup)
-    pools    = extract_pools(soup)
-    starters = extract_starter_rows(soup)
+    ev_key, ev_data = extract_ev_table(root)
+    pools    = extract_pools(root)
+    starters = extract_starter_rows(root)
     if not starters:
         return []
 
+    base    = {**meta, **pools}   # einmal pro Rennen, nicht pro Starter
     results = []
     for s in starters:
-        horse = s['horse_name']
-        ev    = ev_data.get(horse, {})
-        fp    = ev.get('finish_position', s.get('finish_position', ''))
-        ev_q  = ev.get('ev_quote', '')
-        row   = {**meta, **pools}
-        row.update({
-            'start_nr':        s.get('start_nr', ''),
-            'box_nr':          s.get('box_nr', ''),
-            'horse_name':      horse,
-            'age':             s.get('age', ''),
-            'gender':          s.get('gender', ''),
-            'weight_kg':       s.get('weight_kg', ''),
-            'jockey':          s.get('jockey', ''),
-            'trainer':         s.get('trainer', ''),
-            'ml_quote':        s.get('ml_quote', ''),
-            'sieg_toto':       s.get('sieg_toto', ''),
-            'fsieg_bm':        s.get('fsieg_bm', ''),
-            'fplatz_bm':       s.get('fplatz_bm', ''),
-            'ev_quote':        ev_q,
-            'finish_position': fp,
-            'finish_distance': ev.get('finish_distance', s.get('finish_distance', '')),
-            'implied_prob':    round(1 / pf(ev_q), 4) if pf(ev_q) else '',
-            'won':             1 if str(fp) == '1' else 0,
-            'placed':          1 if str(fp) in ['1', '2', '3'] else 0,
+        # extract_starter_rows liefert alle Starter-Keys → ein Dict-Literal pro Row
+        ev = ev_data.get(s[ev_key], {})
+        results.append({
+            **base,
+            **s,
+            'ev_quote':        ev.get('ev_quote', ''),
+            'finish_position': ev.get('finish_position', s['finish_position']),
+            'finish_distance': ev.get('finish_distance', s['finish_distance']),
         })
-        results.append(row)
+    add_derived_fields(results)
     return results
 
 
-def extract_race_meta(soup) -> dict:
+def parse_race_html(html: str, race_id: int) -> list[dict]:
+    """Roh-HTML → Rows; läuft im ProcessPool (Argumente/Ergebnis picklebar)."""
+    return parse_race_page(parse_html(html), race_id)
+
+
+def add_derived_fields(rows: list[dict]) -> None:
+    """
+    implied_prob / won / placed für ein ganzes Rennen in einem Durchgang.
+    ev_quote ist bereits float (oder '') – kein erneutes pf() nötig.
+    finish_position ist int oder Nicht-Ziffern-Text ('', 'DNF') → direkter
+    int-Vergleich statt str(), Text fällt dabei automatisch auf 0.
+    """
+    for r in rows:
+        q  = r['ev_quote']
+        fp = r['finish_position']
+        r['implied_prob'] = round(1 / q, 4) if q else ''
+        r['won']          = int(fp == 1)
+        r['placed']       = int(fp in (1, 2, 3))
+
+
+def extract_race_meta(root, text: str) -> dict:
     meta = {}
-    for label, cls in [('race_date', '-breadcrumb-date'),
-                        ('venue',     '-breadcrumb-name'),
-                        ('race_nr',   '-breadcrumb-race')]:
-        el = soup.find(class_=lambda c: c and cls in c if c else False)
-        meta[label] = el.get_text(strip=True) if el else ''
+    for label, xp in _XP_BREADCRUMBS:
+        el = _first(xp(root))
+        meta[label] = _text(el) if el is not None else ''
 
     if meta.get('race_date'):
         for fmt in ('%d.%m.%y', '%d.%m.%Y'):
@@ -153,79 +253,88 @@ def extract_race_meta(soup) -> dict:
             except ValueError:
                 pass
 
-    rn = re.search(r'R(\d+)', meta.get('race_nr', ''))
+    rn = _PAT_RACE_NR.search(meta.get('race_nr', ''))
     meta['race_nr'] = int(rn.group(1)) if rn else ''
 
-    text = soup.get_text(separator=' ')
-    for pattern, key, cast in [
-        (r'(\d{3,4})\s*m',                  'distance_m',      int),
-        (r'Preisgeld\D{0,10}([\d.]+)\s*€',  'prize_eur',       lambda x: int(x.replace('.', ''))),
-        (r'Starter\D{0,5}(\d+)',             'field_size',      int),
-        (r'(\d{2}:\d{2})\s*Uhr',            'start_time',      str),
-        (r'Kategorie\s+([A-Z])',             'race_class',      str),
-        (r'Alter:\s*(\d+)',                  'age_restriction', str),
-    ]:
-        m = re.search(pattern, text)
-        try:
-            meta[key] = cast(m.group(1)) if m else ''
-        except Exception:
-            meta[key] = ''
+    _parse_meta_fields(text, meta)
 
     meta['surface']   = 'Flach' if 'Flach' in text else ('Sand' if 'Sand' in text else '')
-    nm = re.search(r'Rennen\s+(?:des|der|vom|von)\s+(.+?)(?:\n|,|\|)', text)
+    nm = _PAT_NAME.search(text)
     meta['race_name'] = nm.group(1).strip() if nm else ''
     return meta
 
 
-def extract_starter_rows(soup) -> list[dict]:
-    rows   = soup.find_all(class_=lambda c: c and '--rg-is-starter' in c if c else False)
+def _parse_meta_fields(text: str, meta: dict) -> None:
+    """Feste Feldliste → ein Block pro Feld, Casts inline (kein Pattern-Loop)."""
+    m = _PAT_DISTANCE.search(text)
+    meta['distance_m'] = int(m.group(1)) if m else ''
+
+    m = _PAT_PRIZE.search(text)
+    prize = m.group(1).replace('.', '') if m else ''
+    meta['prize_eur'] = int(prize) if prize else ''   # "." allein → leer
+
+    m = _PAT_STARTERS.search(text)
+    meta['field_size'] = int(m.group(1)) if m else ''
+
+    m = _PAT_TIME.search(text)
+    meta['start_time'] = m.group(1) if m else ''
+
+    m = _PAT_CLASS.search(text)
+    meta['race_class'] = m.group(1) if m else ''
+
+    m = _PAT_AGE.search(text)
+    meta['age_restriction'] = m.group(1) if m else ''
+
+
+def extract_starter_rows(root) -> list[dict]:
+    rows   = _XP_STARTER_ROWS(root)
     result = []
     for row in rows:
         s        = {}
-        name_div = row.find(class_='race__grid__row__name')
-        if not name_div:
+        name_div = _first(_XP_ROW_NAME(row))
+        if name_div is None:
             continue
-        strongs = name_div.find_all('strong')
-        spans   = name_div.find_all('span')
-        s['start_nr']   = strongs[0].get_text(strip=True).rstrip('.') if strongs else ''
-        s['horse_name'] = strongs[1].get_text(strip=True) if len(strongs) > 1 else ''
-        bm = re.search(r'\((\d+)\)', spans[0].get_text() if spans else '')
+        strongs, spans = [], []
+        for el in _XP_NAME_PARTS(name_div):   # ein Baum-Durchlauf für beide Tags
+            (strongs if el.tag == 'strong' else spans).append(el)
+        s['start_nr']   = _text(strongs[0]).rstrip('.') if strongs else ''
+        s['horse_name'] = _text(strongs[1]) if len(strongs) > 1 else ''
+        bm = _PAT_PARENS_NUM.search(spans[0].text_content() if spans else '')
         s['box_nr'] = bm.group(1) if bm else ''
 
-        pills = row.find_all(class_='race__grid__row__vars__pills')
-        ag    = pills[0].get_text(strip=True) if pills else ''
-        wt    = pills[1].get_text(strip=True) if len(pills) > 1 else ''
-        am    = re.match(r'(\d+)j\.\s*([A-Z])', ag)
+        pills = _XP_PILLS(row)
+        ag    = _text(pills[0]) if pills else ''
+        wt    = _text(pills[1]) if len(pills) > 1 else ''
+        am    = _PAT_AGEGEN.match(ag)
         s['age']    = int(am.group(1)) if am else ''
         s['gender'] = am.group(2) if am else ''
-        wm = re.search(r'([\d.]+)\s*kg', wt)
+        wm = _PAT_WEIGHT.search(wt)
         s['weight_kg'] = float(wm.group(1)) if wm else ''
 
-        j = row.find(class_='race__grid__row__humans__jockey')
-        t = row.find(class_='race__grid__row__humans__trainer')
-        s['jockey']  = j.get_text(strip=True) if j else ''
-        s['trainer'] = re.sub(r'^\(|\)$', '', t.get_text(strip=True)) if t else ''
+        j = _first(_XP_JOCKEY(row))
+        t = _first(_XP_TRAINER(row))
+        s['jockey']  = _text(j) if j is not None else ''
+        s['trainer'] = _PAT_TRAINER_PARENS.sub('', _text(t)) if t is not None else ''
 
         s['sieg_toto'] = _odd(row, 'tote')
         s['fsieg_bm']  = _odd(row, 'fix')
         s['fplatz_bm'] = _odd(row, 'plcodd_fix')
 
-        tt = row.find('table', class_='trendTrendsTable')
+        tt = _first(_XP_TREND_TABLE(row))
         s['ml_quote'] = ''
-        if tt:
-            trows = [r for r in tt.find_all('tr')
-                     if not r.find(class_='trendTrendsTable__row__divider')]
+        if tt is not None:
+            trows = _XP_TREND_ROWS(tt)
             if len(trows) > 1:
-                ml_td = trows[1].find('td', class_='ml')
-                s['ml_quote'] = pf(ml_td.get_text(strip=True)) if ml_td else ''
-
-        fd = row.find(class_='race__grid__row__finish')
-        if fd:
-            strong = fd.find('strong')
-            dist   = fd.find(class_=lambda c: c and 'font-size' in c if c else False)
-            fp     = re.search(r'(\d+)', strong.get_text(strip=True) if strong else '')
+                ml_td = _first(_XP_ML(trows[1]))
+                s['ml_quote'] = pf(_text(ml_td)) if ml_td is not None else ''
+
+        fd = _first(_XP_FINISH(row))
+        if fd is not None:
+            strong = _first(_XP_STRONG(fd))
+            dist   = _first(_XP_FONT_SIZE(fd))
+            fp     = _PAT_FINISH.search(_text(strong) if strong is not None else '')
             s['finish_position'] = int(fp.group(1)) if fp else ''
-            s['finish_distance'] = dist.get_text(strip=True) if dist else ''
+            s['finish_distance'] = _text(dist) if dist is not None else ''
         else:
             s['finish_position'] = s['finish_distance'] = ''
 
@@ -234,38 +343,54 @@ def extract_starter_rows(soup) -> list[dict]:
 
 
 def _odd(row, t):
-    d = row.find(class_=lambda c: c and f'type-{t}' in c if c else False)
-    if not d:
+    d = _first(_XP_ODDS[t](row))
+    if d is None:
         return ''
-    v = d.find(class_='c-runner-odd__value')
-    return pf(re.sub(r'[^\d,\.]', '', v.get_text(strip=True))) if v else ''
+    v = _first(_XP_ODD_VALUE(d))
+    m = _PAT_DECIMAL.search(v.text_content()) if v is not None else None
+    return float(m.group(1).replace(',', '.')) if m else ''
 
 
-def extract_ev_table(soup) -> dict:
-    t = next((t for t in soup.find_all('table') if 'Ev.-Quote' in t.get_text()), None)
-    if not t:
-        return {}
+def extract_ev_table(root) -> tuple[str, dict]:
+    """
+    Returns: (Join-Feld der Starter, {Schlüssel: EV-Daten}).
+    Join über die Startnummer, wenn die Kopfzeile eine 'Nr'-Spalte ausweist
+    (robuster als der Pferdename), sonst wie bisher über den Pferdenamen (Spalte 2).
+    """
+    t = next((t for t in root.iter('table') if 'Ev.-Quote' in t.text_content()), None)
+    if t is None:
+        return 'horse_name', {}
+    rows = _XP_ROWS(t)
+    head = [_text(c).rstrip('.') for c in _XP_CELLS(rows[0])] if rows else []
+    if 'Nr' in head:
+        field, k = 'start_nr', head.index('Nr')
+    else:
+        field, k = 'horse_name', 2
     out = {}
-    for row in t.find_all('tr')[1:]:
-        cols = [c.get_text(strip=True) for c in row.find_all(['td', 'th'])]
-        if len(cols) >= 4:
-            out[cols[2]] = {
+    for row in rows[1:]:
+        cols = [_text(c) for c in _XP_CELLS(row)]
+        if len(cols) >= 4 and len(cols) > k:
+            out[cols[k].rstrip('.') if field == 'start_nr' else cols[k]] = {
                 'finish_position': int(cols[0]) if cols[0].isdigit() else cols[0],
                 'ev_quote':        pf(cols[3]),
                 'finish_distance': cols[5] if len(cols) > 5 else '',
             }
-    return out
+    return field, out
 
 
-def extract_pools(soup) -> dict:
-    pools = {}
-    for t in soup.find_all('table'):
-        text = t.get_text(separator=' ', strip=True)
-        m2 = re.match(r'^(\d+\s*-\s*\d+)\s+([\d,\.]+)$', text)
+def extract_pools(root) -> dict:
+    pools = {'zweier_combo': '', 'zweier_quote': '', 'dreier_combo': '', 'dreier_quote': ''}
+    for t in root.iter('table'):
+        text = _text(t, ' ')
+        # Pool-Tabellen sind winzig ("2 - 1 45,20") → große Tabellen ohne Regex überspringen
+        if len(text) > 40 or '-' not in text:
+            continue
+        m2 = _PAT_POOL2.match(text)
         if m2:
             pools['zweier_combo'] = m2.group(1).replace(' ', '')
             pools['zweier_quote'] = pf(m2.group(2))
-        m3 = re.match(r'^(\d+\s*-\s*\d+\s*-\s*\d+)\s+([\d,\.]+)$', text)
+            continue
+        m3 = _PAT_POOL3.match(text)
         if m3:
             pools['dreier_combo'] = m3.group(1).replace(' ', '')
             pools['dreier_quote'] = pf(m3.group(2))
@@ -273,213 +398,412 @@ def extract_pools(soup) -> dict:
 
 
 def pf(s):
+    return _pf(s if isinstance(s, str) else str(s))
+
+
+@lru_cache(maxsize=4096)
+def _pf(s: str):
+    # Quoten-Strings ("2,5", "11,0", ...) wiederholen sich ständig → memoisiert
     try:
-        return float(str(s).replace(',', '.').strip())
+        return float(s.replace(',', '.').strip())
     except Exception:
         return ''
 
 
 # ── Playwright ────────────────────────────────────────────────────────────────
 
-async def fetch(page, url: str) -> str:
+# (Selektor, Marker) je Seitentyp:
+#   Selektor → darauf wartet Playwright, dann steht der gescrapte DOM
+#   Marker   → stehen alle im reinen HTTP-Response, ist die Seite serverseitig
+#              gerendert und der Browser wird gar nicht gebraucht
+WAIT_CALENDAR = ('.ttml__country', ('ttml__country',))
+WAIT_MEETING  = ('.meetinginfo__racenumber', ('meetinginfo__racenumber',))
+# Race: auf die Einlaufzellen in den JS-gerenderten Starter-Rows warten – die
+# Breadcrumb gehört zum statischen Rahmen und stünde schon bei domcontentloaded da.
+# Marker: alles, woran die Race-Pipeline hängt – fehlt 'Ergebnis', würde das
+# Rennen sonst dauerhaft als no_result abgehakt statt im Browser nachgeladen;
+# ohne Einlaufzellen ist der Ergebnisblock noch nicht fertig gerendert.
+WAIT_RACE     = ('[class*="--rg-is-starter"] .race__grid__row__finish',
+                 ('--rg-is-starter', 'Ergebnis', 'race__grid__row__finish'))
+
+# Ressourcen, die der Parser nie liest → gar nicht erst laden
+# (Scripts/XHR bleiben erlaubt: der Browser ist ja gerade der JS-Fallback)
+_BLOCKED_RESOURCES = frozenset({'image', 'media', 'font', 'stylesheet',
+                                'websocket', 'manifest', 'texttrack'})
+
+
+async def _block_assets(route):
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def fetch(page, url: str, expect: tuple[str, tuple], http=None,
+                throttle=None) -> str:
+    """HTTP-Schnellpfad, sonst Browser – jeder Abruf belegt einen eigenen `throttle`-Slot."""
+    selector, markers = expect
+    if http is not None:
+        if throttle is not None:
+            await throttle()
+        try:
+            r = await http.get(url)
+            if r.status_code == 200 and all(m in r.text for m in markers):
+                return r.text
+        except Exception:
+            pass   # → Browser-Fallback
+    if throttle is not None:
+        await throttle()
     try:
-        await page.goto(url, wait_until='networkidle', timeout=30000)
-        await asyncio.sleep(0.5)
+        await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        try:
+            await page.wait_for_selector(selector, timeout=8000)
+        except Exception:
+            pass   # z.B. Renntag ohne Meetings – Seite trotzdem zurückgeben
+        try:
+            # Rest der Seite (EV-/Pool-Tabellen) nachladen lassen, aber begrenzt
+            await page.wait_for_load_state('networkidle', timeout=5000)
+        except Exception:
+            pass   # Tracker o.ä. halten das Netz offen – DOM steht trotzdem
         return await page.content()
     except Exception as e:
         print(f'  ⚠️  {url}: {e}')
         return ''
 
 
+async def fetch_cached(page, url: str, expect: tuple[str, tuple], cache_file,
+                       http=None, throttle=None) -> str:
+    """
+    Wie fetch(), aber mit gzip-Cache auf Platte (cache_file=None → kein Cache).
+    Nur echte Netzabrufe laufen (in fetch) durch `throttle` – Cache-Treffer nicht.
+    Gecacht wird nur eine vollständige Seite (alle Marker aus `expect` vorhanden),
+    sonst würde ein Timeout oder eine Fehlerseite bei jedem Re-Run übersprungen.
+    """
+    if cache_file and cache_file.exists():
+        try:
+            return gzip.decompress(cache_file.read_bytes()).decode('utf-8')
+        except Exception:
+            pass   # abgeschnittene/kaputte Datei (z.B. abgebrochener Lauf) → wie Cache-Miss
+    html = await fetch(page, url, expect, http, throttle)
+    if cache_file and html and all(m in html for m in expect[1]):
+        # erst Temp-Datei, dann atomar umbenennen → nie eine halbe .gz im Cache
+        tmp = cache_file.with_name(cache_file.name + '.tmp')
+        tmp.write_bytes(gzip.compress(html.encode('utf-8'), compresslevel=1))
+        os.replace(tmp, cache_file)
+    return html
+
+
+def _throttle(rate: float):
+    """
+    Gemeinsames Tempo aller Worker: höchstens `rate` Netzabrufe pro Sekunde.
+    Jeder Aufruf reserviert den nächsten freien Slot (ohne await dazwischen →
+    kein Lock nötig) und schläft bis dahin; rate <= 0 → ungebremst.
+    """
+    interval = 1 / rate if rate > 0 else 0
+    next_at  = 0.0
+
+    async def wait():
+        nonlocal next_at
+        if not interval:
+            return
+        now     = asyncio.get_running_loop().time()
+        at      = max(now, next_at)
+        next_at = at + interval
+        if at > now:
+            await asyncio.sleep(at - now)
+
+    return wait
+
+
+async def _drain(pages, items, handle):
+    """
+    Arbeitet `items` parallel ab: ein Worker pro Playwright-Page,
+    jeder holt sich das nächste Item aus einer gemeinsamen Queue.
+    """
+    queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+
+    async def worker(page):
+        while not queue.empty():
+            await handle(page, queue.get_nowait())
+
+    # Bricht ein Worker ab, die übrigen mitbeenden – sonst laufen sie ungebremst
+    # weiter, während run() schon Browser und Dateien schließt.
+    tasks = [asyncio.create_task(worker(page)) for page in pages]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 async def run(args):
     from playwright.async_api import async_playwright
+    import httpx
 
     out_dir = Path(args.output)
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = Path(args.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def cached(name):
+        return cache_dir / f'{name}.html.gz' if cache_dir else None
+
+    # Checkpoint: scraped_ids.json (Stand des letzten sauberen Endes)
+    #           + scraped_ids.log  (eine ID pro Zeile, laufend angehängt)
     cp_file  = out_dir / 'scraped_ids.json'
+    cp_log   = out_dir / 'scraped_ids.log'
     done_ids = set()
     if cp_file.exists():
-        with open(cp_file) as f:
-            done_ids = set(json.load(f))
+        done_ids = set(orjson.loads(cp_file.read_bytes()))
+    if cp_log.exists():
+        done_ids.update(int(rid) for rid in cp_log.read_text().split())
+    if done_ids:
         print(f'📋 Checkpoint: {len(done_ids)} bereits verarbeitet')
 
+    # Parsen ist CPU-gebunden → eigene Prozesse, Event-Loop lädt weiter.
+    # forkserver statt fork: die Worker starten erst beim ersten Parse, wenn
+    # Event-Loop, Playwright und httpx schon Threads laufen haben.
+    pool = ProcessPoolExecutor(max_workers=args.workers,
+                               mp_context=multiprocessing.get_context('forkserver'))
+
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
-        ctx     = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0'
-        )
-        page = await ctx.new_page()
-
-        # ── Race-IDs bestimmen ────────────────────────────────────────────────
-        if args.race_id:
-            race_ids = [args.race_id]
-
-        elif args.from_date:
-            to_date   = args.to_date or datetime.today().strftime('%Y-%m-%d')
-            print(f'📅 Sammle DE-Rennen: {args.from_date} → {to_date}\n')
-
-            race_ids  = []
-            current   = datetime.strptime(args.from_date, '%Y-%m-%d')
-            end       = datetime.strptime(to_date, '%Y-%m-%d')
-            total_days = (end - current).days + 1
-            scanned    = 0
-
-            while current <= end:
-                ds = current.strftime('%Y-%m-%d')
-
-                # STUFE 1: Kalenderseite
-                cal_html = await fetch(page, f'{BASE}/races/{ds}')
-                if not cal_html:
-                    current += timedelta(days=1)
-                    continue
-
-                cal_soup = BeautifulSoup(cal_html, 'html.parser')
-                de_meetings = get_de_meetings_from_calendar(cal_soup)
-
-                if de_meetings:
-                    day_race_ids = []
-                    for meet in de_meetings:
+        http    = None
+        try:
+            ctx     = await browser.new_context(user_agent=USER_AGENT)
+            await ctx.route('**/*', _block_assets)
+            pages = [await ctx.new_page() for _ in range(args.concurrency)]
+            # Ein Tempo für alle Pages statt fester Pausen pro Worker
+            throttle = _throttle(args.rate)
+
+            # Schnellpfad: serverseitig gerenderte Seiten per HTTP, Browser nur als Fallback
+            if not args.no_http:
+                http = httpx.AsyncClient(http2=True, timeout=15, follow_redirects=True,
+                                         headers={'User-Agent': USER_AGENT})
+
+            # ── Race-IDs bestimmen ────────────────────────────────────────────
+            if args.race_id:
+                race_ids = {args.race_id}
+
+            elif args.from_date:
+                to_date   = args.to_date or datetime.today().strftime('%Y-%m-%d')
+                print(f'📅 Sammle DE-Rennen: {args.from_date} → {to_date}\n')
+
+                race_ids  = set()
+                start     = datetime.strptime(args.from_date, '%Y-%m-%d')
+                end       = datetime.strptime(to_date, '%Y-%m-%d')
+                days      = [(start + timedelta(days=d)).strftime('%Y-%m-%d')
+                             for d in range((end - start).days + 1)]
+                scanned   = 0
+                today     = datetime.today().strftime('%Y-%m-%d')
+
+                async def scan_day(page, ds):
+                    # Eine kaputte Kalender-/Meeting-Seite (lxml wirft z.B. ValueError bei
+                    # Encoding-Deklaration oder leerem Dokument) kostet nur diesen Tag
+                    try:
+                        await _scan_day(page, ds)
+                    except Exception as e:
+                        print(f'  {ds} | ❌ {e} – Tag übersprungen')
+
+                async def _scan_day(page, ds):
+                    nonlocal scanned
+                    # Kalender/Meetings ab heute können sich noch ändern → nicht cachen
+                    day_cache = cached if ds < today else (lambda name: None)
+
+                    # STUFE 1: Kalenderseite
+                    cal_html = await fetch_cached(
+                        page, f'{BASE}/races/{ds}', WAIT_CALENDAR, day_cache(ds), http, throttle
+                    )
+                    if not cal_html:
+                        return
+
+                    for meet in get_de_meetings_from_calendar(parse_html(cal_html)):
                         mid   = meet['meeting_id']
                         venue = meet['venue']
 
                         # STUFE 2: Meeting-Seite → Race-IDs
-                        meet_html = await fetch(
-                            page, f'{BASE}/races/{ds}?meeting={mid}'
+                        meet_html = await fetch_cached(
+                            page, f'{BASE}/races/{ds}?meeting={mid}', WAIT_MEETING,
+                            day_cache(f'{ds}_{mid}'), http, throttle
                         )
                         if meet_html:
-                            meet_soup = BeautifulSoup(meet_html, 'html.parser')
-                            rids      = get_race_ids_from_meeting(meet_soup)
+                            rids = get_race_ids_from_meeting(parse_html(meet_html))
 
                             if rids:
-                                day_race_ids.extend(rids)
+                                race_ids.update(rids)
                                 print(f'  {ds} | {venue} (mid={mid}): '
-                                      f'{len(rids)} Rennen → IDs {rids}')
+                                      f'{len(rids)} Rennen → IDs {sorted(rids)}')
                             else:
                                 print(f'  {ds} | {venue} (mid={mid}): '
                                       f'⚠️  keine Race-IDs in Meeting-Seite')
 
-                        await asyncio.sleep(0.3)
-
-                    race_ids.extend(day_race_ids)
-
-                scanned += 1
-                if scanned % 30 == 0:
-                    print(f'\n  ··· {scanned}/{total_days} Tage | '
-                          f'{len(race_ids)} IDs gesamt ···\n')
-
-                current += timedelta(days=1)
-                await asyncio.sleep(0.2)
-
-            race_ids = sorted(set(race_ids))
-            print(f'\n✅ {len(race_ids)} Race-IDs gesammelt\n')
-
-        else:
-            print('❌ Nutze --race-id oder --from-date')
-            sys.exit(1)
-
-        # ── STUFE 3: Race-Seiten scrapen ──────────────────────────────────────
-        todo        = [rid for rid in race_ids if rid not in done_ids]
-        all_results = []
-        new_done    = []
-        stats       = {'ok': 0, 'no_result': 0, 'no_starter': 0}
-
-        print(f'🏇 Scraping {len(todo)} Rennen '
-              f'({len(race_ids) - len(todo)} bereits bekannt)...\n')
-
-        for i, race_id in enumerate(todo, 1):
-            try:
-                html = await fetch(page, f'{BASE}/race/{race_id}')
-                if not html:
-                    new_done.append(race_id)
-                    continue
-
-                if 'Ergebnis' not in html:
-                    stats['no_result'] += 1
-                    new_done.append(race_id)
-                    await asyncio.sleep(0.5)
-                    continue
-
-                rows = parse_race_page(html, race_id)
-                if rows:
-                    all_results.extend(rows)
-                    stats['ok'] += 1
-                    r0 = rows[0]
-                    print(f'  [{i:>4}/{len(todo)}] ✅ {race_id} | '
-                          f'{r0["race_date"]} {r0["venue"]} '
-                          f'R{r0["race_nr"]} | {len(rows)} Starter')
-                else:
-                    stats['no_starter'] += 1
-                    print(f'  [{i:>4}/{len(todo)}] ⚠️  {race_id} | '
-                          f'Ergebnis vorhanden aber keine Starter-Rows')
-
-                new_done.append(race_id)
-
-                if i % 200 == 0:
-                    _save_cp(cp_file, done_ids | set(new_done))
-                    _write_csv(all_results, out_dir,
-                               f'{args.from_date or args.race_id}_partial')
-                    print(f'\n  💾 Checkpoint: {i}/{len(todo)} | '
-                          f'ok={stats["ok"]} noResult={stats["no_result"]}\n')
-
-                await asyncio.sleep(0.8)
-
-            except KeyboardInterrupt:
-                print('\n⚠️  Abgebrochen – speichere...')
-                break
-            except Exception as e:
-                print(f'  [{i:>4}/{len(todo)}] ❌ {race_id}: {e}')
-                new_done.append(race_id)
-
-        await browser.close()
+                    scanned += 1
+                    if scanned % 30 == 0:
+                        print(f'\n  ··· {scanned}/{len(days)} Tage | '
+                              f'{len(race_ids)} IDs gesamt ···\n')
+
+                await _drain(pages, days, scan_day)
+                print(f'\n✅ {len(race_ids)} Race-IDs gesammelt\n')
+
+            else:
+                print('❌ Nutze --race-id oder --from-date')
+                sys.exit(1)
+
+            # ── STUFE 3: Race-Seiten scrapen ──────────────────────────────────
+            todo     = sorted(race_ids - done_ids)
+            stats    = {'ok': 0, 'no_result': 0, 'no_starter': 0}
+            summary  = {'venues': Counter(), 'races': set(), 'starters': 0,
+                        'winners': 0, 'ev_ok': 0}
+            started  = 0
+            loop     = asyncio.get_running_loop()
+
+            tag = args.from_date or str(args.race_id)
+            if args.to_date:
+                tag += f'_to_{args.to_date}'
+            csv_path = out_dir / f'race_results_{tag}.csv'
+            # 0-Byte-Datei = Vorlauf vor dem ersten Flush gestorben → Header fehlt noch
+            new_csv  = not csv_path.exists() or csv_path.stat().st_size == 0
+
+            print(f'🏇 Scraping {len(todo)} Rennen '
+                  f'({len(race_ids) - len(todo)} bereits bekannt, '
+                  f'{len(pages)} parallel)...\n')
+
+            # CSV einmal öffnen und pro Rennen anhängen – keine Zeilen im RAM halten.
+            # Append-Modus: Resume über den Checkpoint ergänzt die CSV des Vorlaufs.
+            with open(csv_path, 'a', newline='', encoding='utf-8') as csv_fh, \
+                 open(cp_log, 'a') as log_fh:
+                writer = csv.writer(csv_fh)
+                if new_csv:
+                    writer.writerow(FIELDNAMES)
+                    csv_fh.flush()
+
+                def mark_done(race_id):
+                    done_ids.add(race_id)
+                    log_fh.write(f'{race_id}\n')
+                    log_fh.flush()
+
+                async def scrape_race(page, race_id):
+                    nonlocal started
+                    started += 1
+                    i = started
+                    # Abgehakt wird nur, was tatsächlich geparst wurde (oder sicher kein
+                    # Ergebnis hat) – Abruffehler bleiben offen für den nächsten Lauf.
+                    try:
+                        html = await fetch_cached(
+                            page, f'{BASE}/race/{race_id}', WAIT_RACE, cached(race_id),
+                            http, throttle
+                        )
+                    except Exception as e:
+                        print(f'  [{i:>4}/{len(todo)}] ❌ {race_id}: {e}')
+                        return
+                    if not html:
+                        return
+
+                    if 'Ergebnis' not in html:
+                        stats['no_result'] += 1
+                        mark_done(race_id)
+                        return
+
+                    if not all(m in html for m in WAIT_RACE[1]):
+                        # Browser-Snapshot nach Timeout: Ergebnisblock halb gerendert →
+                        # nicht mit leeren Spalten abhaken, nächster Lauf lädt neu
+                        print(f'  [{i:>4}/{len(todo)}] ⚠️  {race_id} | '
+                              f'Ergebnisblock unvollständig – bleibt offen')
+                        return
+
+                    try:
+                        rows = await loop.run_in_executor(pool, parse_race_html, html, race_id)
+                    except BrokenProcessPool:
+                        raise   # Pool tot → jeder weitere Parse schlägt fehl → Lauf abbrechen
+                    except Exception as e:
+                        # Parser-Fehler ist für diese Seite deterministisch → nicht endlos wiederholen
+                        print(f'  [{i:>4}/{len(todo)}] ❌ {race_id}: {e}')
+                        mark_done(race_id)
+                        return
+
+                    if rows:
+                        writer.writerows(map(_ROW_VALUES, rows))
+                        csv_fh.flush()
+                        _tally(summary, rows)
+                        stats['ok'] += 1
+                        r0 = rows[0]
+                        print(f'  [{i:>4}/{len(todo)}] ✅ {race_id} | '
+                              f'{r0["race_date"]} {r0["venue"]} '
+                              f'R{r0["race_nr"]} | {len(rows)} Starter')
+                    else:
+                        stats['no_starter'] += 1
+                        print(f'  [{i:>4}/{len(todo)}] ⚠️  {race_id} | '
+                              f'Ergebnis vorhanden aber keine Starter-Rows')
+
+                    mark_done(race_id)
+
+                    if i % 200 == 0:
+                        print(f'\n  💾 Fortschritt: {i}/{len(todo)} | '
+                              f'ok={stats["ok"]} noResult={stats["no_result"]}\n')
+
+                try:
+                    await _drain(pages, todo, scrape_race)
+                except (KeyboardInterrupt, asyncio.CancelledError):
+                    print('\n⚠️  Abgebrochen – speichere...')
+                except BrokenProcessPool:
+                    print('\n❌ Parse-Prozess abgestürzt – Lauf abgebrochen, '
+                          'offene Rennen bleiben für den nächsten Lauf')
+
+        finally:
+            # auch bei unerwarteten Fehlern: Pool/Browser schließen, Checkpoint sichern
+            pool.shutdown(cancel_futures=True)
+            if http is not None:
+                await http.aclose()
+            await browser.close()
+            _save_cp(cp_file, done_ids)
+            cp_log.unlink(missing_ok=True)   # steckt jetzt vollständig im JSON
 
     # ── Output ────────────────────────────────────────────────────────────────
-    _save_cp(cp_file, done_ids | set(new_done))
     print(f'\n📊 Stats: ok={stats["ok"]} | noResult={stats["no_result"]} | '
           f'noStarter={stats["no_starter"]}')
 
-    if all_results:
-        tag = args.from_date or str(args.race_id)
-        if args.to_date:
-            tag += f'_to_{args.to_date}'
-        csv_path = _write_csv(all_results, out_dir, tag)
-        print(f'✅ CSV: {len(all_results)} Starter → {csv_path}')
-        _summary(all_results)
+    if summary['starters']:
+        print(f'✅ CSV: {summary["starters"]} Starter → {csv_path}')
+        _summary(summary)
     else:
+        if new_csv:
+            csv_path.unlink(missing_ok=True)
         print('⚠️  Keine Ergebnisse – prüfe Logs oben.')
         sys.exit(0)
 
 
-def _write_csv(results, out_dir, tag):
-    path = out_dir / f'race_results_{tag}.csv'
-    with open(path, 'w', newline='', encoding='utf-8') as f:
-        w = csv.DictWriter(f, fieldnames=FIELDNAMES, extrasaction='ignore')
-        w.writeheader()
-        w.writerows(results)
-    return path
+def _save_cp(path, ids):
+    path.write_bytes(orjson.dumps(sorted(ids)))
 
 
-def _save_cp(path, ids):
-    with open(path, 'w') as f:
-        json.dump(sorted(ids), f)
+def _tally(summary, rows):
+    """Summary-Zähler pro Rennen fortschreiben, statt alle Zeilen zu halten."""
+    for r in rows:
+        summary['venues'][r.get('venue', '')] += 1
+        summary['races'].add((r['race_id'], r['race_nr']))
+        summary['winners'] += r.get('won') == 1
+        summary['ev_ok']   += bool(r.get('ev_quote'))
+    summary['starters'] += len(rows)
 
 
-def _summary(results):
-    from collections import Counter
-    venues  = Counter(r.get('venue', '') for r in results)
-    races   = len(set((r['race_id'], r['race_nr']) for r in results))
-    winners = sum(1 for r in results if r.get('won') == 1)
-    ev_ok   = sum(1 for r in results if r.get('ev_quote'))
+def _summary(summary):
+    n = summary['starters']
     print(f'\n📈 Summary:')
-    print(f'  Rennen:         {races}')
-    print(f'  Starter:        {len(results)}')
-    print(f'  Win-Rate:       {100*winners//len(results)}%')
-    print(f'  EV-Quote:       {ev_ok}/{len(results)} gefüllt')
+    print(f'  Rennen:         {len(summary["races"])}')
+    print(f'  Starter:        {n}')
+    print(f'  Win-Rate:       {100*summary["winners"]//n}%')
+    print(f'  EV-Quote:       {summary["ev_ok"]}/{n} gefüllt')
     print(f'\n  Top Venues:')
-    for v, n in venues.most_common(10):
-        print(f'    {v:<25}: {n:>5} Starter')
+    for v, c in summary['venues'].most_common(10):
+        print(f'    {v:<25}: {c:>5} Starter')
 
 
 def main():
@@ -489,6 +813,18 @@ def main():
     g.add_argument('--from-date', type=str)
     p.add_argument('--to-date',   type=str, default=None)
     p.add_argument('--output',    type=str, default='./race_results/')
+    p.add_argument('--cache-dir', type=str, default='./_html_cache/',
+                   help='gzip-Cache für Kalender-, Meeting- und Race-Seiten')
+    p.add_argument('--no-cache',  action='store_true',
+                   help='Cache weder lesen noch schreiben')
+    p.add_argument('--concurrency', type=int, default=4,
+                   help='Anzahl paralleler Playwright-Pages')
+    p.add_argument('--no-http',   action='store_true',
+                   help='Alle Seiten über Playwright laden (kein HTTP-Schnellpfad)')
+    p.add_argument('--rate',      type=float, default=4.0,
+                   help='Max. Netzabrufe pro Sekunde über alle Pages (0 = ungebremst)')
+    p.add_argument('--workers',   type=int, default=os.cpu_count(),
+                   help='Anzahl Prozesse fürs HTML-Parsen')
     args = p.parse_args()
     asyncio.run(run(args))
 